@@ -1,36 +1,112 @@
+import asyncio
+import itertools
 import kopf
+import logging
 import os
+import random
 import time
 import sys
-import kubernetes.client
-from kubernetes import config
-from kubernetes.client.rest import ApiException
+import kubernetes_asyncio.client
+from kubernetes_asyncio import config
+from kubernetes_asyncio.client.rest import ApiException
 
-# Global set to keep track of monitored namespaces
-namespace_monitors = set()
-exempt_namespaces = set()
+# API group of the operator's own CRDs (NamespaceMonitor, ExemptNamespace, RolloutStrategy)
+CRD_GROUP = 'asalaboratory.com'
 
-def trigger_rollout(name, namespace):
+logger = logging.getLogger('vpa-operator')
+log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
+if isinstance(logging.getLevelName(log_level), int):
+    logger.setLevel(log_level)
+else:
+    # An unknown level would make setLevel raise and abort the import
+    logger.setLevel(logging.INFO)
+    logger.warning("Unknown LOG_LEVEL %s, falling back to INFO.", log_level)
+
+# Monitored and exempt namespaces. Handlers replace these frozensets rather than
+# mutating them, so readers always see a consistent snapshot.
+state = {'monitors': frozenset(), 'exempt': frozenset()}
+# Cached RolloutStrategy CRs: namespace -> {CR name: (target deployment or None, strategy)}
+rollout_strategies = {}
+# Last rollout trigger per (namespace, name), used to coalesce back-to-back triggers
+last_rollouts = {}
+ROLLOUT_DEBOUNCE_SECONDS = 5.0
+# Rollout annotation values. Seeded from the wall clock in milliseconds so values
+# keep increasing across operator restarts and never repeat a previous one.
+rollout_seq = itertools.count(time.time_ns() // 1_000_000)
+# Names of existing VPAs per namespace as (fetched_at, task listing them), so the
+# periodic reconcile issues one LIST per namespace rather than one GET per deployment
+vpa_names_cache = {}
+VPA_LIST_TTL_SECONDS = 60.0
+
+# Shared API clients, created once in on_startup after the config is loaded.
+# They all wrap a single ApiClient so every handler reuses one aiohttp session.
+api_client = None
+apps_v1_api = None
+custom_objects_api = None
+api_ext = None
+
+async def release_response(response):
+    """
+    Finishes a response requested with _preload_content=False. The client only
+    raises ApiException for preloaded responses, so check the status here. The
+    body is always read to EOF so aiohttp can return the connection to the pool.
+    """
+    try:
+        body = await response.read()
+        if not 200 <= response.status <= 299:
+            e = ApiException(status=response.status, reason=response.reason)
+            e.body = body
+            raise e
+    finally:
+        response.release()
+
+async def trigger_rollout(name, namespace):
     """
     Triggers a rollout of a deployment by updating an annotation.
+    Skipped if a rollout was already triggered for it within ROLLOUT_DEBOUNCE_SECONDS.
     """
-    apps_v1_api = kubernetes.client.AppsV1Api()
-    deployment = apps_v1_api.read_namespaced_deployment(name, namespace)
-    if 'annotations' not in deployment.spec.template.metadata:
-        deployment.spec.template.metadata.annotations = {}
-    # Use a timestamp or a counter for the annotation value to ensure it changes.
-    deployment.spec.template.metadata.annotations['vpa-update-timestamp'] = str(time.time())
+    key = (namespace, name)
+    now = time.monotonic()
+    if now - last_rollouts.get(key, float('-inf')) < ROLLOUT_DEBOUNCE_SECONDS:
+        logger.debug("Rollout for deployment %s in namespace %s triggered recently. Skipping.", name, namespace)
+        return
+    last_rollouts[key] = now
+
+    # Use a counter for the annotation value to ensure it changes.
+    # A strategic-merge patch touches only the annotation, so no prior read is needed.
+    patch = {
+        "spec": {
+            "template": {
+                "metadata": {
+                    "annotations": {
+                        "vpa-update-timestamp": str(next(rollout_seq))
+                    }
+                }
+            }
+        }
+    }
+    # The response is unused: skip deserializing it into models
     try:
-        apps_v1_api.patch_namespaced_deployment(name, namespace, deployment)
-        print(f"Triggered rollout for deployment {name} in namespace {namespace}.")
+        response = await apps_v1_api.patch_namespaced_deployment(
+            name,
+            namespace,
+            patch,
+            _content_type="application/strategic-merge-patch+json",
+            _preload_content=False,
+        )
+        await release_response(response)
+        logger.info("Triggered rollout for deployment %s in namespace %s.", name, namespace)
     except ApiException as e:
-        print(f"Exception when calling AppsV1Api->patch_namespaced_deployment: {e}")
+        logger.error("Exception when calling AppsV1Api->patch_namespaced_deployment: %s", e)
 
-def create_vpa(name, namespace, update_mode):
+async def create_vpa(name, namespace, update_mode):
     """
     Creates or updates a VPA with the specified update mode.
+    Returns True if the VPA was applied.
     """
-    vpa_api = kubernetes.client.CustomObjectsApi()
+    # Kept as a literal on purpose: every nested dict carries a per-deployment
+    # field, so CPython builds it from constants about as cheaply as it gets, and
+    # the client needs a dict it can JSON-encode itself.
     vpa_body = {
         "apiVersion": "autoscaling.k8s.io/v1",
         "kind": "VerticalPodAutoscaler",
@@ -49,203 +125,311 @@ def create_vpa(name, namespace, update_mode):
             }
         }
     }
-    # Try to update an existing VPA, if it doesn't exist, create a new one.
+    # Server-side apply creates the VPA if it is missing and updates it otherwise.
+    # kubernetes_asyncio JSON-encodes apply-patch bodies itself, so pass the dict.
     try:
-        vpa_api.patch_namespaced_custom_object(
+        response = await custom_objects_api.patch_namespaced_custom_object(
             group="autoscaling.k8s.io",
             version="v1",
             namespace=namespace,
             plural="verticalpodautoscalers",
             name=name,
             body=vpa_body,
+            field_manager="vpa-operator",
+            force=True,
+            _content_type="application/apply-patch+yaml",
+            _preload_content=False,
         )
-        print(f"VPA updated for deployment {name} in namespace {namespace}.")
+        await release_response(response)
+        logger.info("VPA applied for deployment %s in namespace %s.", name, namespace)
+        return True
     except ApiException as e:
-        if e.status == 404:  # VPA doesn't exist, try creating it
-            try:
-                vpa_api.create_namespaced_custom_object(
-                    group="autoscaling.k8s.io",
-                    version="v1",
-                    namespace=namespace,
-                    plural="verticalpodautoscalers",
-                    body=vpa_body,
-                )
-                print(f"VPA created for deployment {name} in namespace {namespace}.")
-            except ApiException as e:
-                print(f"Exception when creating VPA: {e}")
-        else:
-            print(f"Exception when updating VPA: {e}")
+        logger.error("Exception when applying VPA: %s", e)
+        return False
 
 def get_rollout_strategy(namespace, deployment_name):
     """
     Retrieves the rollout strategy for the specified namespace and deployment.
+    Served from the cache primed in on_startup and kept current by the
+    rolloutstrategies event handler.
     """
-    custom_objects_api = kubernetes.client.CustomObjectsApi()
-    try:
-        rollout_strategies = custom_objects_api.list_namespaced_custom_object(
-            group="asalaboratory.com",
-            version="v1",
-            namespace=namespace,
-            plural="rolloutstrategies"
-        )
-        for strategy in rollout_strategies.get("items", []):
-            if strategy.get("spec", {}).get("target") == deployment_name or not strategy.get("spec", {}).get("target"):
-                return strategy.get("spec", {}).get("strategy")
-    except ApiException as e:
-        print(f"Failed to retrieve rollout strategies: {e}")
-    return None  # Return None if no specific strategy is found
+    # A strategy targeting the deployment wins over a namespace-wide one. CRs are
+    # checked in name order so overlapping ones resolve the same way every time.
+    namespace_wide = None
+    for _, (target, strategy) in sorted(rollout_strategies.get(namespace, {}).items()):
+        if target == deployment_name:
+            return strategy
+        if target is None and namespace_wide is None:
+            namespace_wide = strategy
+    return namespace_wide  # None if no specific strategy is found
 
-def check_vpa_installed(api_instance, vpa_crds, retries=3, initial_delay=1):
+def cache_rollout_strategy(namespace, name, spec):
+    """Stores a RolloutStrategy CR; an empty target applies to the whole namespace."""
+    rollout_strategies.setdefault(namespace, {})[name] = (spec.get('target') or None, spec.get('strategy'))
+
+def is_namespace_monitored(namespace):
+    """Check if namespace is monitored and not exempt."""
+    monitors = state['monitors']
+    return (not monitors or namespace in monitors) and namespace not in state['exempt']
+
+async def check_vpa_installed(api_instance, vpa_crds, retries=3, initial_delay=1, max_delay=30):
     """
     Check if the specified VPA CRDs are installed.
 
     Parameters:
-    - api_instance: An instance of the CustomObjectsApi from the Kubernetes client.
+    - api_instance: An instance of the ApiextensionsV1Api from the Kubernetes client.
     - vpa_crds: A list of VPA CRD names to check.
     - retries: Maximum number of retries for checking each CRD.
     - initial_delay: Initial delay between retries, doubled after each attempt.
+    - max_delay: Upper bound for the delay between retries.
     """
     for crd_name in vpa_crds:
         attempt = 0
         delay = initial_delay
         while attempt < retries:
             try:
-                api_response = api_instance.read_custom_resource_definition(crd_name)
-                print(f"Found CRD: {crd_name}")
+                await api_instance.read_custom_resource_definition(crd_name)
+                logger.info("Found CRD: %s", crd_name)
                 break  # Successfully found the CRD, break out of the retry loop
             except ApiException as e:
                 if e.status == 404:
-                    print(f"CRD {crd_name} not found. VPA operator might not be installed.")
-                    if attempt == retries - 1:  # Last attempt
-                        print("Required VPA operator not found. Exiting...")
-                        sys.exit(1)
-                else:
-                    print(f"Attempt {attempt + 1} failed: Error checking CRD {crd_name}: {e}")
-                time.sleep(delay)
-                delay *= 2  # Exponential backoff
+                    # A missing CRD won't show up while we wait, no point retrying
+                    logger.error("CRD %s not found. VPA operator might not be installed.", crd_name)
+                    logger.error("Required VPA operator not found. Exiting...")
+                    sys.exit(1)
+                if e.status != 429 and (e.status or 0) < 500:
+                    logger.error("Error checking CRD %s: %s", crd_name, e)
+                    break  # Not a transient error, retrying won't help
+                logger.warning("Attempt %s failed: Error checking CRD %s: %s", attempt + 1, crd_name, e)
                 attempt += 1
+                if attempt == retries:  # Last attempt
+                    logger.error("Could not verify CRD %s. Exiting...", crd_name)
+                    sys.exit(1)
+                # Exponential backoff with jitter so replicas don't retry in lockstep
+                await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+                delay = min(delay * 2, max_delay)
 
-@kopf.on.create('asalaboratory.com', 'v1', 'namespacemonitors')
-def on_namespace_monitor_create(spec, **kwargs):
+@kopf.on.create(CRD_GROUP, 'v1', 'namespacemonitors')
+async def on_namespace_monitor_create(spec, **kwargs):
     namespace = spec.get('namespace')
     if namespace:
-        namespace_monitors.add(namespace)
-        print(f"Added {namespace} to monitored namespaces.")
+        state['monitors'] = state['monitors'] | {namespace}
+        logger.info("Added %s to monitored namespaces.", namespace)
 
-@kopf.on.delete('asalaboratory.com', 'v1', 'namespacemonitors')
-def on_namespace_monitor_delete(spec, **kwargs):
+@kopf.on.delete(CRD_GROUP, 'v1', 'namespacemonitors')
+async def on_namespace_monitor_delete(spec, **kwargs):
     namespace = spec.get('namespace')
-    if namespace in namespace_monitors:
-        namespace_monitors.remove(namespace)
-        print(f"Removed {namespace} from monitored namespaces.")
+    if namespace in state['monitors']:
+        state['monitors'] = state['monitors'] - {namespace}
+        logger.info("Removed %s from monitored namespaces.", namespace)
 
-@kopf.on.create('asalaboratory.com', 'v1', 'exemptnamespaces')
-def on_exempt_namespace_create(spec, **kwargs):
+@kopf.on.create(CRD_GROUP, 'v1', 'exemptnamespaces')
+async def on_exempt_namespace_create(spec, **kwargs):
     namespace = spec.get('namespace')
     if namespace:
-        exempt_namespaces.add(namespace)
-        print(f"Added {namespace} to exempt namespaces.")
+        state['exempt'] = state['exempt'] | {namespace}
+        logger.info("Added %s to exempt namespaces.", namespace)
 
-@kopf.on.delete('asalaboratory.com', 'v1', 'exemptnamespaces')
-def on_exempt_namespace_delete(spec, **kwargs):
+@kopf.on.delete(CRD_GROUP, 'v1', 'exemptnamespaces')
+async def on_exempt_namespace_delete(spec, **kwargs):
     namespace = spec.get('namespace')
-    if namespace in exempt_namespaces:
-        exempt_namespaces.remove(namespace)
-        print(f"Removed {namespace} from exempt namespaces.")
-
-@kopf.on.create('apps', 'v1', 'deployments')
-def on_deployment_create(namespace, name, spec, **kwargs):
-    # Check if namespace is monitored and not exempt
-    if (not namespace_monitors or namespace in namespace_monitors) and (namespace not in exempt_namespaces):
-        print(f"Deployment created in monitored namespace: {namespace}. Creating VPA...")
-        strategy = get_rollout_strategy(namespace, name) or "Auto"  # Default to Auto if not specified
-        create_vpa(name, namespace, strategy)
-        trigger_rollout(name, namespace)
+    if namespace in state['exempt']:
+        state['exempt'] = state['exempt'] - {namespace}
+        logger.info("Removed %s from exempt namespaces.", namespace)
+
+# A raw event handler keeps the cache read-only towards the cluster: Kopf adds no
+# finalizers or annotations to RolloutStrategy CRs, so they delete without us.
+@kopf.on.event(CRD_GROUP, 'v1', 'rolloutstrategies')
+async def on_rollout_strategy_event(type, namespace, name, spec, **kwargs):
+    if type == 'DELETED':
+        strategies = rollout_strategies.get(namespace, {})
+        strategies.pop(name, None)
+        if not strategies:
+            rollout_strategies.pop(namespace, None)
+        logger.info("Removed rollout strategy %s in namespace %s from cache.", name, namespace)
     else:
-        print(f"Namespace {namespace} is exempt or not monitored. Ignoring deployment.")
+        cache_rollout_strategy(namespace, name, spec)
+        logger.info("Cached rollout strategy %s in namespace %s.", name, namespace)
+
+def is_deployment_monitored(namespace, **_):
+    """
+    Kopf filter for the deployment handlers. Deployments it rejects never reach a
+    handler, so Kopf also skips patching its progress annotations and finalizers
+    onto them.
+    """
+    return is_namespace_monitored(namespace)
+
+@kopf.on.create('apps', 'v1', 'deployments', when=is_deployment_monitored)
+async def on_deployment_create(namespace, name, **kwargs):
+    logger.info("Deployment created in monitored namespace: %s. Creating VPA...", namespace)
+    strategy = get_rollout_strategy(namespace, name) or "Auto"  # Default to Auto if not specified
+    if await create_vpa(name, namespace, strategy):
+        await trigger_rollout(name, namespace)
 
-@kopf.on.delete('apps', 'v1', 'deployments')
-def on_deployment_delete(name, namespace, **kwargs):
+@kopf.on.delete('apps', 'v1', 'deployments', when=is_deployment_monitored)
+async def on_deployment_delete(name, namespace, **kwargs):
     """
     Reacts to deployment deletions and deletes the corresponding VPA.
     """
-    if (not namespace_monitors or namespace in namespace_monitors) and (namespace not in exempt_namespaces):
-        print(f"Deployment deleted in monitored namespace: {namespace}. Deleting VPA...")
-        delete_vpa(name, namespace)
-    else:
-        print(f"Namespace {namespace} is exempt or not monitored. Ignoring deployment.")
+    logger.info("Deployment deleted in monitored namespace: %s. Deleting VPA...", namespace)
+    await delete_vpa(name, namespace)
+    last_rollouts.pop((namespace, name), None)
 
-def delete_vpa(name, namespace):
+async def delete_vpa(name, namespace):
     """
     Deletes a VPA for a given deployment.
     """
-    vpa_api = kubernetes.client.CustomObjectsApi()
-
     try:
         # Delete VPA
-        vpa_api.delete_namespaced_custom_object(
+        response = await custom_objects_api.delete_namespaced_custom_object(
             group="autoscaling.k8s.io",
             version="v1",
             namespace=namespace,
             plural="verticalpodautoscalers",
             name=name,
+            _preload_content=False,
         )
-        print(f"VPA deleted for deployment {name} in namespace {namespace}.")
+        await release_response(response)
+        logger.info("VPA deleted for deployment %s in namespace %s.", name, namespace)
     except ApiException as e:
-        print(f"Exception when calling CustomObjectsApi->delete_namespaced_custom_object: {e}")
+        logger.error("Exception when calling CustomObjectsApi->delete_namespaced_custom_object: %s", e)
+
+async def fetch_vpa_names(namespace):
+    """
+    Lists the VPAs in a namespace and returns their names.
+    """
+    vpas = await custom_objects_api.list_namespaced_custom_object(
+        group="autoscaling.k8s.io",
+        version="v1",
+        namespace=namespace,
+        plural="verticalpodautoscalers",
+    )
+    return {vpa['metadata']['name'] for vpa in vpas.get('items', [])}
+
+async def get_vpa_names(namespace):
+    """
+    Returns the names of the VPAs in a namespace, listing them at most once per
+    VPA_LIST_TTL_SECONDS. Concurrent callers share the same in-flight LIST.
+    """
+    now = time.monotonic()
+    entry = vpa_names_cache.get(namespace)
+    if entry is None or now - entry[0] >= VPA_LIST_TTL_SECONDS:
+        entry = (now, asyncio.ensure_future(fetch_vpa_names(namespace)))
+        vpa_names_cache[namespace] = entry
+    try:
+        return await entry[1]
+    except Exception:
+        # Don't keep serving a failed LIST (API or connection error) until the TTL runs out
+        if vpa_names_cache.get(namespace) is entry:
+            del vpa_names_cache[namespace]
+        raise
+
+async def ensure_vpa_exists(name, namespace):
+    """
+    Creates the VPA for a deployment if it is missing, e.g. because its create
+    event was lost from the watch stream.
+    """
+    try:
+        vpa_names = await get_vpa_names(namespace)
+    except Exception as e:
+        logger.error("Failed to list VPAs in namespace %s: %s", namespace, e)
+        return
+    if name in vpa_names:
+        return
+    logger.info("Deployment %s in namespace %s has no VPA. Creating VPA...", name, namespace)
+    strategy = get_rollout_strategy(namespace, name) or "Auto"  # Default to Auto if not specified
+    # Only restart pods once the VPA exists, otherwise a failing apply would
+    # trigger a rollout on every timer run
+    if await create_vpa(name, namespace, strategy):
+        vpa_names.add(name)
+        await trigger_rollout(name, namespace)
+
+@kopf.timer('apps', 'v1', 'deployments', interval=300.0, idle=60.0, when=is_deployment_monitored)
+async def reconcile_deployment(name, namespace, **kwargs):
+    """
+    Periodically makes sure monitored deployments have a VPA.
+    """
+    await ensure_vpa_exists(name, namespace)
 
 @kopf.on.startup()
-def configure(settings: kopf.OperatorSettings, **_):
-    settings.watching.server_timeout = 60
-    settings.watching.client_timeout = 60
+async def configure(settings: kopf.OperatorSettings, **_):
+    # Let the server close idle watches before the client gives up on them, so
+    # streams are renewed cleanly instead of silently missing events
+    settings.watching.server_timeout = 120
+    settings.watching.client_timeout = 150
+    settings.watching.reconnect_backoff = 1.0
+    # Kopf copies each object's essence into an annotation after handling it. The
+    # deployment handlers only need name/namespace, so keep the pod template out of
+    # it rather than duplicating it into every Deployment (and every watch event).
+    settings.persistence.diffbase_storage = kopf.AnnotationsDiffBaseStorage(
+        ignored_fields=['spec.template'],
+    )
 
 def get_namespaces_from_crs(crs):
     """Extract namespaces from CRs."""
     return {cr['spec']['namespace'] for cr in crs['items'] if 'namespace' in cr['spec']}
 
 @kopf.on.startup()
-def on_startup(**_):
+async def on_startup(**_):
+    global api_client, apps_v1_api, custom_objects_api, api_ext
+
     config.load_incluster_config()
-    api_instance = kubernetes.client.CustomObjectsApi()
-    v1 = kubernetes.client.CoreV1Api()
+
+    # Handlers run concurrently on the event loop; size the shared connection pool
+    # so they reuse keep-alive connections instead of reconnecting. Never go below
+    # the client's own default (the aiohttp connector limit).
+    cfg = kubernetes_asyncio.client.Configuration.get_default_copy()
+    cfg.connection_pool_maxsize = max(cfg.connection_pool_maxsize, (os.cpu_count() or 4) * 5)
+    kubernetes_asyncio.client.Configuration.set_default(cfg)
+
+    api_client = kubernetes_asyncio.client.ApiClient()
+    apps_v1_api = kubernetes_asyncio.client.AppsV1Api(api_client)
+    custom_objects_api = kubernetes_asyncio.client.CustomObjectsApi(api_client)
+    api_ext = kubernetes_asyncio.client.ApiextensionsV1Api(api_client)
+    v1 = kubernetes_asyncio.client.CoreV1Api(api_client)
 
     default_namespaces_file = 'default_namespaces'
     default_namespaces = set()
 
-    api_ext = kubernetes.client.ApiextensionsV1Api()
-
     vpa_crds = ['verticalpodautoscalers.autoscaling.k8s.io', 'verticalpodautoscalercheckpoints.autoscaling.k8s.io']
 
-    check_vpa_installed(api_ext, vpa_crds)
+    await check_vpa_installed(api_ext, vpa_crds)
 
+    # Prime the strategy cache before any deployment is handled, since the
+    # deployment and rolloutstrategies watches start at the same time
     try:
-        with open(default_namespaces_file, 'r') as file:
-            for line in file:
-                default_namespaces.add(line.strip())
+        rollout_strategy_crs = await custom_objects_api.list_cluster_custom_object(group=CRD_GROUP, version="v1", plural="rolloutstrategies")
+        for cr in rollout_strategy_crs.get("items", []):
+            cache_rollout_strategy(cr["metadata"]["namespace"], cr["metadata"]["name"], cr.get("spec", {}))
+        logger.info("Cached %s rollout strategies.", len(rollout_strategy_crs.get("items", [])))
+    except ApiException as e:
+        logger.error("Failed to retrieve rollout strategies: %s", e)
+
+    try:
+        with open(default_namespaces_file, 'r', encoding='ascii') as file:
+            default_namespaces = {line.strip() for line in file.read().splitlines() if line.strip()}
     except FileNotFoundError:
-        print(f"File {default_namespaces_file} not found. No namespaces will be excluded.")
+        logger.warning("File %s not found. No namespaces will be excluded.", default_namespaces_file)
     except Exception as e:
-        print(f"Error reading {default_namespaces_file}: {e}")
+        logger.error("Error reading %s: %s", default_namespaces_file, e)
 
-    print(f"Excluded namespaces: {default_namespaces}")
+    logger.info("Excluded namespaces: %s", default_namespaces)
 
     try:
-        namespace_monitor_crs = api_instance.list_cluster_custom_object(group="asalaboratory.com", version="v1", plural="namespacemonitors")
-        exempt_namespace_crs = api_instance.list_cluster_custom_object(group="asalaboratory.com", version="v1", plural="exemptnamespaces")
+        namespace_monitor_crs = await custom_objects_api.list_cluster_custom_object(group=CRD_GROUP, version="v1", plural="namespacemonitors")
+        exempt_namespace_crs = await custom_objects_api.list_cluster_custom_object(group=CRD_GROUP, version="v1", plural="exemptnamespaces")
         
         namespace_monitors = get_namespaces_from_crs(namespace_monitor_crs)
         exempt_namespaces = get_namespaces_from_crs(exempt_namespace_crs)
 
-        print(f"Monitored Namespaces: {namespace_monitors}")
+        logger.info("Monitored Namespaces: %s", namespace_monitors)
 
-        for namespace in default_namespaces():
+        for namespace in default_namespaces:
             if namespace:
-                print(f"Operator's namespace {oper_namespace} added to exempt namespaces.")
+                logger.info("Default namespace %s added to exempt namespaces.", namespace)
                 exempt_namespaces.add(namespace)
-            else:
-                print("Operator's namespace could not be determined.")
 
-        namespaces = v1.list_namespace().items
+        namespaces = (await v1.list_namespace()).items
         initial_namespaces = {ns.metadata.name for ns in namespaces if ns.metadata.name not in default_namespaces}
 
         # Get current namespace and add to exempt namespaces
@@ -253,20 +437,31 @@ def on_startup(**_):
         if (not namespace_monitors or oper_namespace in namespace_monitors) and (oper_namespace not in exempt_namespaces):
             if oper_namespace:
                 exempt_namespaces.add(oper_namespace)
-                print(f"Operator's namespace {oper_namespace} added to exempt namespaces.")
+                logger.info("Operator's namespace %s added to exempt namespaces.", oper_namespace)
             else:
-                print("Operator's namespace could not be determined.")
+                logger.warning("Operator's namespace could not be determined.")
+
+        # Publish to the module state read by the handlers, keeping anything they
+        # may already have recorded
+        state['monitors'] = state['monitors'] | namespace_monitors
+        state['exempt'] = state['exempt'] | exempt_namespaces
 
         for namespace in initial_namespaces:
-            if (not namespace_monitors or namespace in namespace_monitors) and (namespace not in exempt_namespaces):
-                print(f"Namespace {namespace} will be monitored.")
+            if is_namespace_monitored(namespace):
+                logger.info("Namespace %s will be monitored.", namespace)
             else:
-                print(f"Namespace {namespace} is exempt or not selected for monitoring.")
+                logger.info("Namespace %s is exempt or not selected for monitoring.", namespace)
         
-        print(f"Final Default Exempt Namespaces: {exempt_namespaces}")
+        logger.info("Final Default Exempt Namespaces: %s", state['exempt'])
 
     except ApiException as e:
         if e.status == 503:
-            print("Kubernetes API is temporarily unavailable. Please check your cluster status.")
+            logger.error("Kubernetes API is temporarily unavailable. Please check your cluster status.")
         else:
-            print(f"An error occurred: {e}")
+            logger.error("An error occurred: %s", e)
+
+
+@kopf.on.cleanup()
+async def on_cleanup(**_):
+    if api_client is not None:
+        await api_client.close()